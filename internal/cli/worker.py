@@ -16,20 +16,45 @@ Environment variables REQUIRED:
 Environment variables OPTIONAL:
 - WORKER_HOSTNAME: Custom hostname for worker (default: auto-detected)
 - HEARTBEAT_INTERVAL: Seconds between heartbeats (default: 30)
+- HEARTBEAT_MAX_INTERVAL: Upper bound for the heartbeat interval while the
+  Control Plane is unreachable (default: 4x HEARTBEAT_INTERVAL; values below
+  HEARTBEAT_INTERVAL are raised to it)
+- MAX_CONCURRENT_ACTIVITIES: Max activities executed in parallel (default: 10)
+- MAX_CONCURRENT_WORKFLOW_TASKS: Max workflow tasks executed in parallel (default: 10)
 """
 
 import asyncio
+import functools
+import json
+import logging
 import os
+import random
 import sys
 from pathlib import Path
 import structlog
 import httpx
 import socket
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 from temporalio.worker import Worker
 from temporalio.client import Client, TLSConfig
 
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to stdlib json
+    orjson = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -46,23 +71,143 @@ from app.activities.team_activities import (
 )
 
 # Configure structured logging
-import logging
-
 structlog.configure(
     processors=[
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
+        structlog.processors.format_exc_info,
+        # orjson renders straight to bytes, so pair it with a bytes logger.
+        # OPT_NON_STR_KEYS matches stdlib json, which stringifies dict keys.
+        structlog.processors.JSONRenderer(
+            serializer=orjson.dumps, option=orjson.OPT_NON_STR_KEYS
+        )
+        if orjson is not None
+        else structlog.processors.JSONRenderer(),
     ],
     wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
-    logger_factory=structlog.PrintLoggerFactory(),
+    logger_factory=(
+        structlog.BytesLoggerFactory()
+        if orjson is not None
+        else structlog.PrintLoggerFactory()
+    ),
 )
 
 logger = structlog.get_logger()
 
+# Seconds idle connections outlive the longest expected heartbeat gap
+KEEPALIVE_MARGIN = 30.0
+
+# Shared HTTP client for all Control Plane traffic (registration, heartbeats).
+# Created once in run_worker() so connections are pooled and kept alive
+# instead of paying a new TCP + TLS handshake per request.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def init_http_client(
+    kubiya_api_key: str,
+    max_heartbeat_interval: float = 30,
+) -> httpx.AsyncClient:
+    """
+    Create the shared Control Plane HTTP client.
+
+    Args:
+        kubiya_api_key: Kubiya API key, sent as a default Authorization header
+        max_heartbeat_interval: Longest gap between heartbeats (including
+            backoff); idle connections are kept alive longer than this
+
+    Returns:
+        The shared httpx.AsyncClient instance
+    """
+    global _http_client
+
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            # Multiplex heartbeats and other requests over one connection;
+            # httpx falls back to HTTP/1.1 if the server does not offer h2.
+            http2=HTTP2_AVAILABLE,
+            # Keep idle connections longer than the longest heartbeat gap so
+            # each heartbeat reuses the warm TLS connection.
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=max_heartbeat_interval + KEEPALIVE_MARGIN,
+            ),
+            # Bodies are pre-serialized JSON, so Content-Type is a default too
+            headers={
+                "Authorization": f"Bearer {kubiya_api_key}",
+                "Content-Type": "application/json",
+            },
+        )
+
+    return _http_client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared Control Plane HTTP client."""
+    if _http_client is None:
+        raise RuntimeError("HTTP client not initialized - call init_http_client() first")
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared Control Plane HTTP client if it was created."""
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
-@dataclass
+
+# Heartbeats are small and frequent; fail fast instead of using the 30s default
+HEARTBEAT_TIMEOUT = httpx.Timeout(10.0)
+
+# Attempts made to reach the Control Plane before registration gives up
+REGISTRATION_MAX_ATTEMPTS = 5
+
+# Transport errors worth retrying; others (e.g. UnsupportedProtocol from a
+# malformed CONTROL_PLANE_URL) are configuration mistakes and fail at once
+TRANSIENT_REQUEST_ERRORS = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+# Gateway errors worth retrying; anything else is reported immediately
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+# Consecutive heartbeat failures tolerated before the interval backs off
+HEARTBEAT_LIVES = 3
+
+
+def _json_dumps(data: dict) -> bytes:
+    """Serialize a request body to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _response_excerpt(response: httpx.Response, limit: int) -> str:
+    """Decode at most `limit` bytes of a response body for error logging."""
+    return response.content[:limit].decode("utf-8", "replace")
+
+
+# Static worker metadata reported to the Control Plane; it never changes
+# for the lifetime of the process, so build it once at import.
+_WORKER_METADATA = {
+    "python_version": sys.version,
+    "platform": sys.platform,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _default_hostname() -> str:
+    """Return the auto-detected worker hostname (resolved once)."""
+    return socket.gethostname()
+
+
+@dataclass(frozen=True)
 class WorkerConfig:
     """Configuration received from Control Plane registration"""
     worker_id: str
@@ -73,11 +218,48 @@ class WorkerConfig:
     temporal_api_key: str
     organization_id: str
     control_plane_url: str
+    environment_short: str = field(init=False)  # Environment name without the org prefix
+    heartbeat_url: str = field(init=False)
+    # Heartbeat fields that never change for this worker
+    heartbeat_fields: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "environment_short",
+            sys.intern(self.environment_name.rsplit(".", 1)[-1]),
+        )
+        object.__setattr__(
+            self,
+            "heartbeat_url",
+            f"{self.control_plane_url}/api/v1/workers/heartbeat",
+        )
+        object.__setattr__(
+            self,
+            "heartbeat_fields",
+            {
+                "worker_id": self.worker_id,
+                "environment_name": self.environment_short,
+                "worker_metadata": {},
+            },
+        )
+
+
+# WorkerConfig fields the registration response must provide as strings
+_REGISTRATION_FIELDS = (
+    "worker_id",
+    "worker_token",
+    "environment_name",
+    "temporal_namespace",
+    "temporal_host",
+    "temporal_api_key",
+    "organization_id",
+    "control_plane_url",
+)
 
 
 async def register_with_control_plane(
     control_plane_url: str,
-    kubiya_api_key: str,
     environment_name: str,
     hostname: Optional[str] = None
 ) -> WorkerConfig:
@@ -86,7 +268,6 @@ async def register_with_control_plane(
 
     Args:
         control_plane_url: Control Plane API URL
-        kubiya_api_key: Kubiya API key for authentication
         environment_name: Environment/task queue to join
         hostname: Worker hostname (auto-detected if not provided)
 
@@ -94,57 +275,89 @@ async def register_with_control_plane(
         WorkerConfig with all necessary configuration
 
     Raises:
-        Exception if registration fails
+        Exception if registration fails (connection errors and 502/503/504
+        responses are retried up to REGISTRATION_MAX_ATTEMPTS times first)
     """
     if not hostname:
-        hostname = socket.gethostname()
+        hostname = _default_hostname()
 
     registration_data = {
         "environment_name": environment_name,
         "hostname": hostname,
-        "worker_metadata": {
-            "python_version": sys.version,
-            "platform": sys.platform,
-        }
+        "worker_metadata": _WORKER_METADATA,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{control_plane_url}/api/v1/workers/register",
-                json=registration_data,
-                headers={"Authorization": f"Bearer {kubiya_api_key}"}
+        client = get_http_client()
+        body = _json_dumps(registration_data)
+
+        # Retry transient failures (connection errors and gateway 5xx
+        # responses) with exponential backoff + jitter
+        for attempt in range(1, REGISTRATION_MAX_ATTEMPTS + 1):
+            try:
+                response = await client.post(
+                    f"{control_plane_url}/api/v1/workers/register",
+                    content=body,
+                )
+            except TRANSIENT_REQUEST_ERRORS as e:
+                if attempt == REGISTRATION_MAX_ATTEMPTS:
+                    raise
+                error = str(e)
+            else:
+                if (
+                    response.status_code not in RETRYABLE_STATUS_CODES
+                    or attempt == REGISTRATION_MAX_ATTEMPTS
+                ):
+                    break
+                error = f"HTTP {response.status_code}"
+
+            delay = min(30, 2 ** attempt) + random.random()
+            logger.warning(
+                "worker_registration_retry",
+                attempt=attempt,
+                delay=round(delay, 2),
+                error=error,
             )
+            await asyncio.sleep(delay)
 
-            if response.status_code != 200:
-                logger.error(
-                    "worker_registration_failed",
-                    status_code=response.status_code,
-                    response=response.text[:500]
-                )
-                raise Exception(
-                    f"Failed to register with Control Plane: {response.status_code} - {response.text[:200]}"
-                )
+        if not response.is_success:
+            logger.error(
+                "worker_registration_failed",
+                status_code=response.status_code,
+                response=_response_excerpt(response, 500)
+            )
+            raise Exception(
+                f"Failed to register with Control Plane: {response.status_code} - {_response_excerpt(response, 200)}"
+            )
 
+        # Any 2xx is accepted, but registration needs a full config body
+        try:
             data = response.json()
-            logger.info(
-                "worker_registered_successfully",
-                worker_id=data.get("worker_id"),
-                environment_name=data.get("environment_name"),
-                org_id=data.get("organization_id"),
+            fields = {name: data[name] for name in _REGISTRATION_FIELDS}
+            invalid = [name for name, value in fields.items() if not isinstance(value, str)]
+            if invalid:
+                raise TypeError(f"non-string fields: {', '.join(invalid)}")
+            config = WorkerConfig(**fields)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error(
+                "worker_registration_failed",
+                status_code=response.status_code,
+                # No body excerpt: a 2xx body carries worker/Temporal credentials
+                error=f"invalid registration response: {e!r}",
             )
-
-            return WorkerConfig(
-                worker_id=data["worker_id"],
-                worker_token=data["worker_token"],
-                environment_name=data["environment_name"],
-                temporal_namespace=data["temporal_namespace"],
-                temporal_host=data["temporal_host"],
-                temporal_api_key=data["temporal_api_key"],
-                organization_id=data["organization_id"],
-                control_plane_url=data["control_plane_url"],
+            raise Exception(
+                f"Failed to register with Control Plane: {response.status_code} - invalid registration response"
             )
 
+        logger.info(
+            "worker_registered_successfully",
+            worker_id=config.worker_id,
+            environment_name=config.environment_name,
+            org_id=config.organization_id,
+        )
+
+        return config
+
     except httpx.RequestError as e:
         logger.error("control_plane_connection_failed", error=str(e))
         raise Exception(f"Failed to connect to Control Plane: {e}")
@@ -152,7 +365,6 @@ async def register_with_control_plane(
 
 async def send_heartbeat(
     config: WorkerConfig,
-    kubiya_api_key: str,
     status: str = "active",
     tasks_processed: int = 0,
     current_task_id: Optional[str] = None
@@ -162,7 +374,6 @@ async def send_heartbeat(
 
     Args:
         config: Worker configuration
-        kubiya_api_key: Kubiya API key for authentication
         status: Worker status (active, idle, busy)
         tasks_processed: Number of tasks processed
         current_task_id: Currently executing task ID
@@ -171,32 +382,30 @@ async def send_heartbeat(
         True if successful, False otherwise
     """
     heartbeat_data = {
-        "worker_id": config.worker_id,
-        "environment_name": config.environment_name.split(".")[-1],  # Extract environment name
+        **config.heartbeat_fields,
         "status": status,
         "tasks_processed": tasks_processed,
         "current_task_id": current_task_id,
-        "worker_metadata": {}
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{config.control_plane_url}/api/v1/workers/heartbeat",
-                json=heartbeat_data,
-                headers={"Authorization": f"Bearer {kubiya_api_key}"}
-            )
+        client = get_http_client()
+        response = await client.post(
+            config.heartbeat_url,
+            content=_json_dumps(heartbeat_data),
+            timeout=HEARTBEAT_TIMEOUT,
+        )
 
-            if response.status_code in [200, 204]:
-                logger.debug("heartbeat_sent", worker_id=config.worker_id)
-                return True
-            else:
-                logger.warning(
-                    "heartbeat_failed",
-                    status_code=response.status_code,
-                    response=response.text[:200]
-                )
-                return False
+        if response.is_success:
+            logger.debug("heartbeat_sent", worker_id=config.worker_id)
+            return True
+        else:
+            logger.warning(
+                "heartbeat_failed",
+                status_code=response.status_code,
+                response=_response_excerpt(response, 200)
+            )
+            return False
 
     except Exception as e:
         logger.warning("heartbeat_error", error=str(e))
@@ -241,26 +450,56 @@ async def create_temporal_client(config: WorkerConfig) -> Client:
         raise
 
 
-async def heartbeat_loop(config: WorkerConfig, kubiya_api_key: str, interval: int = 30):
+async def heartbeat_loop(
+    config: WorkerConfig,
+    interval: int = 30,
+    max_interval: Optional[int] = None,
+    shutdown_event: Optional[asyncio.Event] = None,
+):
     """
     Background task to send periodic heartbeats to Control Plane.
 
+    Heartbeats are sent every `interval` seconds. After HEARTBEAT_LIVES
+    consecutive failures the interval doubles (up to `max_interval`) so an
+    unreachable Control Plane is not hammered; the first success resets it.
+
     Args:
         config: Worker configuration
-        kubiya_api_key: Kubiya API key for authentication
         interval: Seconds between heartbeats
+        max_interval: Upper bound for the backed-off interval, at least
+            `interval` (default: 4x interval)
+        shutdown_event: When set, the loop exits without waiting out the interval
     """
+    shutdown_event = shutdown_event or asyncio.Event()
+    max_interval = max_interval or interval * 4
+    current_interval = interval
+    lives = HEARTBEAT_LIVES
     tasks_processed = 0
 
     while True:
         try:
-            await asyncio.sleep(interval)
-            await send_heartbeat(
+            try:
+                await asyncio.wait_for(shutdown_event.wait(), timeout=current_interval)
+                logger.info("heartbeat_loop_stopped")
+                break
+            except asyncio.TimeoutError:
+                pass
+
+            sent = await send_heartbeat(
                 config=config,
-                kubiya_api_key=kubiya_api_key,
                 status="active",
                 tasks_processed=tasks_processed
             )
+
+            if sent:
+                lives = HEARTBEAT_LIVES
+                current_interval = interval
+            else:
+                lives -= 1
+                if lives <= 0:
+                    lives = HEARTBEAT_LIVES
+                    current_interval = min(max_interval, current_interval * 2)
+                    logger.warning("heartbeat_backing_off", interval=current_interval)
         except asyncio.CancelledError:
             logger.info("heartbeat_loop_cancelled")
             break
@@ -268,6 +507,32 @@ async def heartbeat_loop(config: WorkerConfig, kubiya_api_key: str, interval: in
             logger.warning("heartbeat_loop_error", error=str(e))
 
 
+def _env_int(name: str, default: int) -> int:
+    """
+    Read a positive integer setting from the environment.
+
+    Exits with a configuration error at startup if the value is not a
+    positive integer, rather than failing later inside the worker.
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+
+    if value <= 0:
+        logger.error(
+            "configuration_error",
+            message=f"{name} must be a positive integer, got {raw!r}"
+        )
+        sys.exit(1)
+
+    return value
+
+
 async def run_worker():
     """
     Run the Temporal worker with decoupled architecture.
@@ -285,7 +550,15 @@ async def run_worker():
     control_plane_url = os.environ.get("CONTROL_PLANE_URL")
     environment_name = os.environ.get("ENVIRONMENT_NAME", "default")
     worker_hostname = os.environ.get("WORKER_HOSTNAME")
-    heartbeat_interval = int(os.environ.get("HEARTBEAT_INTERVAL", "30"))
+    heartbeat_interval = _env_int("HEARTBEAT_INTERVAL", 30)
+    # Backoff ceiling never drops below the base interval; the same value
+    # bounds the heartbeat loop and sizes the client's keepalive expiry
+    heartbeat_max_interval = max(
+        _env_int("HEARTBEAT_MAX_INTERVAL", heartbeat_interval * 4),
+        heartbeat_interval,
+    )
+    max_concurrent_activities = _env_int("MAX_CONCURRENT_ACTIVITIES", 10)
+    max_concurrent_workflow_tasks = _env_int("MAX_CONCURRENT_WORKFLOW_TASKS", 10)
 
     # Validate required configuration
     if not kubiya_api_key:
@@ -308,12 +581,20 @@ async def run_worker():
         environment_name=environment_name,
     )
 
+    # Shared HTTP client for registration and heartbeats
+    init_http_client(
+        kubiya_api_key,
+        max_heartbeat_interval=heartbeat_max_interval,
+    )
+
+    shutdown_event = asyncio.Event()
+    heartbeat_task = None
+
     try:
         # Register with Control Plane
         logger.info("registering_with_control_plane")
         config = await register_with_control_plane(
             control_plane_url=control_plane_url,
-            kubiya_api_key=kubiya_api_key,
             environment_name=environment_name,
             hostname=worker_hostname
         )
@@ -331,7 +612,12 @@ async def run_worker():
 
         # Start heartbeat loop in background
         heartbeat_task = asyncio.create_task(
-            heartbeat_loop(config, kubiya_api_key, heartbeat_interval)
+            heartbeat_loop(
+                config,
+                heartbeat_interval,
+                heartbeat_max_interval,
+                shutdown_event=shutdown_event,
+            )
         )
 
         # Create worker
@@ -349,8 +635,8 @@ async def run_worker():
                 get_team_agents,
                 execute_team_coordination,
             ],
-            max_concurrent_activities=10,
-            max_concurrent_workflow_tasks=10,
+            max_concurrent_activities=max_concurrent_activities,
+            max_concurrent_workflow_tasks=max_concurrent_workflow_tasks,
         )
 
         logger.info(
@@ -359,24 +645,40 @@ async def run_worker():
             task_queue=config.environment_name,
             workflows=["AgentExecutionWorkflow", "TeamExecutionWorkflow"],
             activities=5,
+            max_concurrent_activities=max_concurrent_activities,
+            max_concurrent_workflow_tasks=max_concurrent_workflow_tasks,
         )
 
         # Run worker (blocks until interrupted)
         await worker.run()
 
-        # Cancel heartbeat task when worker stops
-        heartbeat_task.cancel()
-        try:
-            await heartbeat_task
-        except asyncio.CancelledError:
-            pass
-
     except KeyboardInterrupt:
         logger.info("temporal_worker_stopping", reason="keyboard_interrupt")
     except Exception as e:
-        import traceback
-        logger.error("temporal_worker_error", error=str(e), traceback=traceback.format_exc())
+        logger.error("temporal_worker_error", error=str(e), exc_info=True)
         raise
+    finally:
+        # Stop heartbeat loop when worker stops
+        shutdown_event.set()
+        if heartbeat_task is not None:
+            try:
+                await asyncio.wait_for(heartbeat_task, timeout=5)
+            except (asyncio.CancelledError, asyncio.TimeoutError):
+                pass
+        await close_http_client()
+
+
+def _run(coro):
+    """Run a coroutine to completion, on a uvloop event loop when available."""
+    if uvloop is None:
+        return asyncio.run(coro)
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+
+    uvloop.install()
+    return asyncio.run(coro)
 
 
 def main():
@@ -384,7 +686,7 @@ def main():
     logger.info("worker_starting")
 
     try:
-        asyncio.run(run_worker())
+        _run(run_worker())
     except KeyboardInterrupt:
         logger.info("worker_stopped")
     except Exception as e: